@@ -7,182 +7,651 @@ and provides the option to save the results to a new spreadsheet/workbook.
 Version: 1.1
 """
 
+import io
 import os
+import re
 import sys
 import argparse
-from typing import List, Dict, Any
+import functools
+import mmap
+from array import array
+from datetime import date, datetime
+from itertools import chain, islice
+from typing import List, Dict, Any, Tuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 import pandas as pd
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment
+import xlsxwriter
+from openpyxl import load_workbook
 from tqdm import tqdm
 
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; TermMatcher falls back to a compiled regex
+    ahocorasick = None
+
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # python-calamine is optional; .xls files are read through pandas without it
+    CalamineWorkbook = None
+
+
+# Characters removed from terms used in output filenames: anything but letters, digits, '_' and space
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w ]')
+
+
+def _column_widths(df: pd.DataFrame, max_width: int = None) -> List[int]:
+    """Width of each DataFrame column when exported: longest header or value plus padding."""
+    widths = []
+    for column in df.columns:
+        lengths = df[column].dropna().astype(str).str.len()
+        width = max(int(lengths.max()) if len(lengths) else 0, len(str(column))) + 2
+        widths.append(min(width, max_width) if max_width else width)
+    return widths
+
+
+def _write_sheet(workbook: xlsxwriter.Workbook, sheet_name: str, df: pd.DataFrame, column_widths: List[int], header_format):
+    """Write a DataFrame to a new worksheet row by row, as constant-memory mode requires."""
+    worksheet = workbook.add_worksheet(sheet_name)
+
+    # Column widths and header styling must be set before rows are flushed to disk
+    for i, width in enumerate(column_widths):
+        worksheet.set_column(i, i, width)
+    worksheet.write_row(0, 0, [str(column) for column in df.columns], header_format)
+
+    # Missing cells are written blank; NaN (and NaT) are the only values unequal to themselves
+    for row_index, row in enumerate(df.itertuples(index=False, name=None), 1):
+        worksheet.write_row(row_index, 0, [None if value != value else value for value in row])
+
 
 class SearchResults:
     """Container for search results with Excel export functionality."""
 
     def __init__(self):
-        self.results = []
+        # One list per field (structure of arrays) rather than a dict per result
+        self.file_path = []
+        self.line_number = array('i')
+        self.line_content = []
+        self.matched_term = []
+        self.sheet_name = []
+        self.column_name = []
+        self.full_row_data = []
+        self.files_with_hits = set()
         self.search_terms = []
         self.search_location = ""
-
-    def add_result(self, file_path: str, line_number: int, line_content: str, matched_term: str = None, sheet_name: str = None, column_name: str = None, full_row_data: dict = None):
-        """Add a search result."""
-        result = {
-            'file_path': file_path,
-            'line_number': line_number,
-            'line_content': line_content.strip()
-        }
-        if matched_term:
-            result['matched_term'] = matched_term
-        if sheet_name:
-            result['sheet_name'] = sheet_name
-        if column_name:
-            result['column_name'] = column_name
-        if full_row_data:
-            result['full_row_data'] = full_row_data
-        self.results.append(result)
+        self.warnings = []  # (file path, error message) pairs, reported once the search finishes
+
+    def __len__(self):
+        return len(self.file_path)
+
+    def add_result(self, file_path: str, line_number: int, line_content: str, matched_term: str = None, sheet_name: str = None, column_name: str = None, full_row_data: dict = None, source_path: str = None):
+        """Add a search result. source_path identifies the file when file_path is only a display name."""
+        self.file_path.append(file_path)
+        self.files_with_hits.add(source_path or file_path)
+        self.line_number.append(line_number)
+        self.line_content.append(line_content.strip())
+        self.matched_term.append(matched_term or None)
+        self.sheet_name.append(sheet_name or None)
+        self.column_name.append(column_name or None)
+        self.full_row_data.append(full_row_data or None)
 
     def save_to_excel(self, output_file: str = None):
         """Save search results to Excel workbook."""
-        if not self.results:
+        if not len(self):
             print("No results to save.")
             return
 
         if output_file is None:
-            safe_terms = "_".join("".join(c for c in term if c.isalnum() or c in (' ', '_')).strip().replace(' ', '_') for term in self.search_terms)
+            safe_terms = "_".join(_UNSAFE_FILENAME_CHARS.sub('', term).strip().replace(' ', '_') for term in self.search_terms)
             output_file = f"search_results_{safe_terms[:50]}.xlsx"
 
-        # Prepare data for DataFrame
-        export_data = []
-        for result in self.results:
-            row_data = {
-                'file_path': result['file_path'],
-                'line_number': result['line_number'],
-                'line_content': result['line_content']
-            }
-
-            if 'matched_term' in result:
-                row_data['matched_term'] = result['matched_term']
-            if 'sheet_name' in result:
-                row_data['sheet_name'] = result['sheet_name']
-            if 'column_name' in result:
-                row_data['column_name'] = result['column_name']
-
-            # Add full row data if available
-            if 'full_row_data' in result:
-                for col_name, col_value in result['full_row_data'].items():
-                    # Prefix with 'source_' to distinguish from search result columns
-                    clean_col_name = f"source_{col_name}" if col_name not in ['file_path', 'line_number', 'line_content', 'sheet_name', 'column_name'] else f"orig_{col_name}"
-                    row_data[clean_col_name] = col_value
-
-            export_data.append(row_data)
-
-        # Create DataFrame
-        df = pd.DataFrame(export_data)
-
-        # Create Excel workbook with formatting
-        with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='Search Results', index=False)
-
-            # Get the workbook and worksheet
-            workbook = writer.book
-            worksheet = writer.sheets['Search Results']
-
-            # Style headers
-            header_font = Font(bold=True, color='FFFFFF')
-            header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
-
-            for cell in worksheet[1]:
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = Alignment(horizontal='center')
-
-            # Auto-adjust column widths
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    if cell.value:
-                        max_length = max(max_length, len(str(cell.value)))
-                adjusted_width = min(max_length + 2, 50)
-                worksheet.column_dimensions[column_letter].width = adjusted_width
-
-            # Add summary sheet
-            summary_data = {
-                'Search Terms': [', '.join(self.search_terms)],
-                'Search Location': [self.search_location],
-                'Total Results': [len(self.results)],
-                'Unique Files': [len(set(r['file_path'] for r in self.results))]
-            }
-
-            summary_df = pd.DataFrame(summary_data)
-            summary_df.to_excel(writer, sheet_name='Summary', index=False)
-
-            # Style summary sheet
-            summary_ws = writer.sheets['Summary']
-            for cell in summary_ws[1]:
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = Alignment(horizontal='center')
-
-            for column in summary_ws.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    if cell.value:
-                        max_length = max(max_length, len(str(cell.value)))
-                summary_ws.column_dimensions[column_letter].width = max_length + 2
+        # Build the DataFrame straight from the columns; optional fields only appear if any result has them
+        columns = {
+            'file_path': self.file_path,
+            'line_number': self.line_number,
+            'line_content': self.line_content
+        }
+        for field in ('matched_term', 'sheet_name', 'column_name'):
+            values = getattr(self, field)
+            if any(value is not None for value in values):
+                columns[field] = values
+
+        df = pd.DataFrame(columns)
+
+        # These columns repeat heavily (one file yields many rows), so store them as categories
+        for field in ('file_path', 'sheet_name', 'column_name', 'matched_term'):
+            if field in df.columns:
+                df[field] = df[field].astype('category')
+
+        # Add full row data if available
+        if any(self.full_row_data):
+            empty_row = {}
+            source_df = pd.DataFrame.from_records([row_data or empty_row for row_data in self.full_row_data])
+            # Prefix with 'source_' to distinguish from search result columns
+            source_df.columns = [f"source_{col_name}" if col_name not in ['file_path', 'line_number', 'line_content', 'sheet_name', 'column_name'] else f"orig_{col_name}" for col_name in source_df.columns]
+            df = pd.concat([df, source_df], axis=1)
+
+        # Size columns from the DataFrame rather than walking every written cell
+        column_widths = _column_widths(df, max_width=50)
+
+        # Add summary sheet
+        summary_data = {
+            'Search Terms': [', '.join(self.search_terms)],
+            'Search Location': [self.search_location],
+            'Total Results': [len(self)],
+            'Unique Files': [len(self.files_with_hits)]
+        }
+
+        summary_df = pd.DataFrame(summary_data)
+
+        # Create Excel workbook with formatting; constant-memory mode streams each row to disk
+        workbook = xlsxwriter.Workbook(output_file, {'constant_memory': True, 'strings_to_urls': False})
+        try:
+            header_format = workbook.add_format({'bold': True, 'bg_color': '#366092', 'font_color': 'white', 'align': 'center'})
+            _write_sheet(workbook, 'Search Results', df, column_widths, header_format)
+            _write_sheet(workbook, 'Summary', summary_df, _column_widths(summary_df), header_format)
+        finally:
+            workbook.close()
 
         print(f"Results saved to: {output_file}")
         return output_file
 
 
-def search_excel_file(search_terms: List[str], file_path: Path, results: SearchResults):
+def _terms_overlap(first: str, second: str) -> bool:
+    """Return True if an occurrence of one term can share characters with an occurrence of the other."""
+    if first in second or second in first:
+        return True
+    shortest = min(len(first), len(second))
+    return any(first.endswith(second[:k]) or second.endswith(first[:k]) for k in range(1, shortest))
+
+
+# Up to this many terms, plain substring checks on the lowered line beat walking an automaton
+DIRECT_MATCH_MAX_TERMS = 12
+
+
+class TermMatcher:
+    """Case-insensitive multi-term matcher, compiled once and reused for every line."""
+
+    def __init__(self, search_terms: List[str]):
+        self.search_terms = list(search_terms)
+        self.lowered_terms = [term.lower() for term in self.search_terms]
+        self.term_pairs = list(zip(self.search_terms, self.lowered_terms))
+        self.automaton = None
+        self.pattern = None
+        self.overlapping_terms = []
+        self.byte_terms = None
+
+        # Terms without line breaks can be located in a whole buffer and mapped back to their lines
+        self.single_line = not any('\r' in term or '\n' in term for term in self.search_terms)
+        if self.single_line and all(term.isascii() for term in self.search_terms):
+            # ASCII terms can be located in raw ASCII file bytes without decoding every line
+            self.byte_terms = [term.encode('ascii') for term in self.lowered_terms]
+
+        if len(self.search_terms) > DIRECT_MATCH_MAX_TERMS:
+            if ahocorasick is not None:
+                # Aho-Corasick automaton: a single pass over the line reports every term
+                self.automaton = ahocorasick.Automaton()
+                for index, lowered in enumerate(self.lowered_terms):
+                    if self.automaton.exists(lowered):
+                        self.automaton.get(lowered).append(index)
+                    else:
+                        self.automaton.add_word(lowered, [index])
+                self.automaton.make_automaton()
+            else:
+                # One group per term, so each regex match names the term that produced it
+                self.pattern = re.compile("|".join(f"({re.escape(term)})" for term in self.lowered_terms))
+                # A term overlapping another can be consumed by that term's match, so it is confirmed separately
+                self.overlapping_terms = [
+                    index for index, term in enumerate(self.lowered_terms)
+                    if any(_terms_overlap(term, other) for other_index, other in enumerate(self.lowered_terms) if other_index != index)
+                ]
+
+    def matched_terms(self, text: str) -> List[str]:
+        """Return the search terms found in text, in the order they were given."""
+        lowered = text.lower()
+
+        if self.automaton is not None:
+            hits = set()
+            for _, indexes in self.automaton.iter(lowered):
+                hits.update(indexes)
+            return [self.search_terms[i] for i in sorted(hits)]
+
+        if self.pattern is not None:
+            # Many terms without pyahocorasick: the matching group identifies the term
+            hits = {match.lastindex - 1 for match in self.pattern.finditer(lowered)}
+            if not hits:
+                return []
+            hits.update(index for index in self.overlapping_terms if self.lowered_terms[index] in lowered)
+            return [self.search_terms[i] for i in sorted(hits)]
+
+        return [term for term, lowered_term in self.term_pairs if lowered_term in lowered]
+
+
+@functools.lru_cache(maxsize=None)
+def _term_matcher(search_terms: tuple) -> TermMatcher:
+    """Return the TermMatcher for these terms, compiling it only once per process."""
+    return TermMatcher(list(search_terms))
+
+
+# Text files at least this large are memory-mapped rather than read into memory
+MMAP_MIN_SIZE = 1024 * 1024
+
+# Memory-mapped files are lowered and searched in slices of about this size, cut at line breaks
+MMAP_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+def search_text_file(matcher: TermMatcher, file_path: str, display_name: str) -> List[Dict[str, Any]]:
+    """
+    Search for terms in a text file, scanning whole chunks rather than line by line.
+
+    Args:
+        matcher: TermMatcher compiled from the search terms
+        file_path: Path to the text file
+        display_name: File name to record in the results
+
+    Returns:
+        List of matches, each a dict of SearchResults.add_result arguments
+    """
+    matches = []
+
+    if not matcher.single_line:
+        # A term containing a line break can only match the line as text mode reads it
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            for line_number, line in enumerate(f, 1):
+                for search_term in matcher.matched_terms(line):
+                    matches.append({'file_path': display_name, 'line_number': line_number, 'line_content': line, 'matched_term': search_term})
+        return matches
+
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size >= MMAP_MIN_SIZE:
+            # Large files are scanned straight from the page cache instead of being copied in
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                _search_buffer(matcher, data, display_name, matches)
+        else:
+            _search_buffer(matcher, f.read(), display_name, matches)
+    return matches
+
+
+def _search_buffer(matcher: TermMatcher, data, display_name: str, matches: List[Dict[str, Any]]):
+    """Find matching lines in a bytes-like buffer of UTF-8 text."""
+    if isinstance(data, bytes):
+        _search_chunk(matcher, data, display_name, 1, matches)
+        return
+
+    # Cut memory maps after a newline so no line, and therefore no match, spans two slices
+    line_number = 1
+    chunk_start = 0
+    while chunk_start < len(data):
+        chunk_end = data.find(b'\n', chunk_start + MMAP_CHUNK_SIZE)
+        chunk_end = len(data) if chunk_end == -1 else chunk_end + 1
+        line_number = _search_chunk(matcher, data[chunk_start:chunk_end], display_name, line_number, matches)
+        chunk_start = chunk_end
+
+
+def _search_chunk(matcher: TermMatcher, chunk: bytes, display_name: str, line_number: int, matches: List[Dict[str, Any]]) -> int:
+    """
+    Search whole lines of UTF-8 text for the terms and return the line number after the chunk.
+
+    ASCII chunks are searched as bytes, decoding only the lines that match; others are decoded once.
+    """
+    if matcher.byte_terms is not None and chunk.isascii():
+        return _search_lines(matcher, chunk, chunk.lower(), matcher.byte_terms, display_name, line_number, matches)
+
+    text = chunk.decode('utf-8', errors='ignore')
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return _search_lines(matcher, text, lowered, matcher.lowered_terms, display_name, line_number, matches)
+
+    # A few characters lower to several (e.g. 'İ'), so offsets in lowered no longer fit text
+    for line in io.StringIO(text, newline=None):
+        for search_term in matcher.matched_terms(line):
+            matches.append({'file_path': display_name, 'line_number': line_number, 'line_content': line.rstrip('\n'), 'matched_term': search_term})
+        line_number += 1
+    return line_number
+
+
+def _search_lines(matcher: TermMatcher, chunk, lowered, terms: list, display_name: str, line_number: int, matches: List[Dict[str, Any]]) -> int:
+    """
+    Locate lowered terms in lowered, a same-length lowered copy of chunk (bytes or str),
+    and record the lines they fall on. Returns the line number after the chunk.
+
+    Each term is located with find over the whole chunk, which is much faster than
+    matching line by line. Lines end at \n, \r\n or a lone \r, as in text mode.
+    """
+    newline, carriage_return = _line_break_chars(lowered)
+    size = len(lowered)
+    has_lf = newline in lowered
+    has_cr = carriage_return in lowered
+
+    # line start -> (line end, indexes of the terms found on that line, in term order)
+    hits = {}
+    for index, term in enumerate(terms):
+        pos = lowered.find(term)
+        while pos != -1:
+            line_start, line_end = 0, size
+            if has_lf:
+                line_start = lowered.rfind(newline, 0, pos) + 1
+                lf_pos = lowered.find(newline, pos)
+                if lf_pos != -1:
+                    line_end = lf_pos
+            if has_cr:
+                line_start = max(line_start, lowered.rfind(carriage_return, line_start, pos) + 1)
+                cr_pos = lowered.find(carriage_return, pos, line_end)
+                if cr_pos != -1:
+                    line_end = cr_pos
+
+            if line_start in hits:
+                hits[line_start][1].append(index)
+            else:
+                hits[line_start] = (line_end, [index])
+
+            # Resume at the next line so a line is reported at most once per term
+            pos = lowered.find(term, line_end + 1)
+
+    counted = 0
+    for line_start in sorted(hits):
+        line_end, indexes = hits[line_start]
+        line_number += _count_line_breaks(lowered, counted, line_start, has_cr)
+        counted = line_start
+
+        line = chunk[line_start:line_end]
+        if isinstance(line, bytes):
+            line = line.decode('ascii')
+        for index in indexes:
+            matches.append({'file_path': display_name, 'line_number': line_number, 'line_content': line, 'matched_term': matcher.search_terms[index]})
+
+    return line_number + _count_line_breaks(lowered, counted, size, has_cr)
+
+
+def _line_break_chars(data) -> tuple:
+    """Return \n and \r as the same type as data, bytes or str."""
+    return ('\n', '\r') if isinstance(data, str) else (b'\n', b'\r')
+
+
+def _count_line_breaks(data, start: int, end: int, has_cr: bool) -> int:
+    """Count \n, \r\n and lone \r line breaks in data[start:end]; both bounds must follow a line break."""
+    newline, carriage_return = _line_break_chars(data)
+    count = data.count(newline, start, end)
+    if has_cr:
+        count += data.count(carriage_return, start, end) - data.count(carriage_return + newline, start, end)
+    return count
+
+
+class WorkbookReader:
+    """Streams rows of cell values from a workbook without building DataFrames."""
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.is_xls = os.path.splitext(file_path)[1].lower() == '.xls'
+
+        if not self.is_xls:
+            self.workbook = load_workbook(file_path, read_only=True, data_only=True)
+            self.sheet_names = self.workbook.sheetnames
+        elif CalamineWorkbook is not None:
+            self.workbook = CalamineWorkbook.from_path(str(file_path))
+            self.sheet_names = self.workbook.sheet_names
+        else:
+            self.workbook = pd.ExcelFile(file_path)
+            self.sheet_names = self.workbook.sheet_names
+
+    def iter_rows(self, sheet_name: str):
+        """Yield each row of a sheet as a tuple of cell values, with None for empty cells."""
+        if not self.is_xls:
+            worksheet = self.workbook[sheet_name]
+            # Read-only mode trusts the stored <dimension> tag, which can be stale; scan the real extent
+            worksheet.reset_dimensions()
+            yield from worksheet.iter_rows(values_only=True)
+        elif CalamineWorkbook is not None:
+            sheet = self.workbook.get_sheet_by_name(sheet_name)
+            # iter_rows() starts at the first used column; pad so cells keep their column positions
+            leading_columns = (None,) * sheet.start[1] if sheet.start else ()
+            for row in sheet.iter_rows():
+                yield leading_columns + tuple(_calamine_value(value) for value in row)
+        else:
+            df = pd.read_excel(self.workbook, sheet_name=sheet_name, header=None).astype(object)
+            yield from df.where(df.notna(), None).itertuples(index=False, name=None)
+
+    def close(self):
+        """Release the underlying workbook handle."""
+        self.workbook.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _calamine_value(value: Any) -> Any:
+    """
+    Normalize a python-calamine cell to what openpyxl/pandas give: empty strings are empty cells,
+    whole floats are ints and dates are midnight datetimes.
+    """
+    if value == "":
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return datetime(value.year, value.month, value.day)
+    return value
+
+
+def _column_names(header: tuple) -> List[str]:
+    """Name columns from the header row the way pandas does ('Unnamed: n', 'name.1' for duplicates)."""
+    names = []
+    seen = {}
+    for index, value in enumerate(header):
+        name = f"Unnamed: {index}" if value is None or value == "" else str(value)
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+# Rows sampled per sheet to decide which columns hold text at all
+TEXT_SAMPLE_ROWS = 32
+
+
+def _non_text_columns(sample_rows: List[tuple], column_count: int) -> set:
+    """
+    Return the indexes of columns whose sampled values are all non-text (numbers, dates, booleans).
+
+    Only the non-text cells of these columns are skipped; text found further down is still searched.
+    """
+    has_value = [False] * column_count
+    has_text = [False] * column_count
+    for row in sample_rows:
+        for index, value in enumerate(row[:column_count]):
+            if value is not None:
+                has_value[index] = True
+                if isinstance(value, str):
+                    has_text[index] = True
+    return {index for index in range(column_count) if has_value[index] and not has_text[index]}
+
+
+def search_excel_file(search_terms: List[str], file_path: str) -> Tuple[List[Dict[str, Any]], List[tuple]]:
     """
     Search for terms in an Excel file across all sheets.
 
     Args:
         search_terms: List of terms to search for
         file_path: Path to the Excel file
-        results: SearchResults object to add matches to
+
+    Returns:
+        Tuple of (matches, warnings): matches are dicts of SearchResults.add_result arguments,
+        warnings are (file path, error message) pairs for unreadable sheets or workbooks
     """
+    matcher = _term_matcher(tuple(search_terms))
+    matches = []
+    warnings = []
+
     try:
-        # Read all sheets from the Excel file
-        xl = pd.ExcelFile(file_path)
+        with WorkbookReader(file_path) as reader:
+            # Search each sheet for the terms, one row at a time
+            for sheet_name in reader.sheet_names:
+                try:
+                    rows = reader.iter_rows(sheet_name)
+                    header = next(rows, None)
+                    if header is None:
+                        continue
+                    column_names = _column_names(header)
+
+                    # In columns that sample as numbers or dates, only text cells are searched
+                    sample = list(islice(rows, TEXT_SAMPLE_ROWS))
+                    non_text_columns = _non_text_columns(sample, len(column_names))
+
+                    for row_number, row in enumerate(chain(sample, rows), 2):  # Excel rows are 1-based and row 1 is the header
+                        if len(row) > len(column_names):
+                            column_names.extend(f"Unnamed: {i}" for i in range(len(column_names), len(row)))
+
+                        # Convert each cell to text once; the same strings are scanned and exported
+                        row_text = [str(value) if value is not None else "" for value in row]
+                        row_text.extend([""] * (len(column_names) - len(row_text)))
+
+                        # Test the whole row in one scan first; NUL cannot occur in a command-line term,
+                        # so no match can span two cells. Only hit rows are examined cell by cell.
+                        searchable = [
+                            col_index for col_index, text in enumerate(row_text)
+                            if text and (col_index not in non_text_columns or isinstance(row[col_index], str))
+                        ]
+                        if not searchable or not matcher.matched_terms("\x00".join(row_text[i] for i in searchable)):
+                            continue
+
+                        # Built on the row's first hit and shared by every result from this row
+                        full_row_data = None
+
+                        for col_index in searchable:
+                            text = row_text[col_index]
+                            matched_terms = matcher.matched_terms(text)
+                            if not matched_terms:
+                                continue
+
+                            # Full row data pairs the column names with the already converted cells
+                            if full_row_data is None:
+                                full_row_data = dict(zip(column_names, row_text))
+
+                            for search_term in matched_terms:
+                                matches.append({
+                                    'file_path': os.path.basename(file_path),
+                                    'line_number': row_number,
+                                    'line_content': text,
+                                    'matched_term': search_term,
+                                    'sheet_name': sheet_name,
+                                    'column_name': column_names[col_index],
+                                    'full_row_data': full_row_data
+                                })
+                except Exception as e:
+                    warnings.append((str(file_path), f"sheet '{sheet_name}': {e}"))
+
+    except Exception as e:
+        warnings.append((str(file_path), str(e)))
+
+    return matches, warnings
+
+
+# Upper bound on text files handed to a worker per task, so small files don't pay a round trip each
+TEXT_BATCH_SIZE = 64
+
+# Matcher for the current process, built once by _init_scanner (per worker when run in a process pool)
+_scanner_matcher = None
+
+
+def _init_scanner(search_terms: List[str]):
+    """Compile the search terms once for every file scanned by this process."""
+    global _scanner_matcher
+    _scanner_matcher = _term_matcher(tuple(search_terms))
+
+
+def _is_excel_file(file_path: str) -> bool:
+    """Return True for workbook files (.xlsx/.xls), which are searched sheet by sheet."""
+    return os.path.splitext(file_path)[1].lower() in ['.xlsx', '.xls']
 
-        # Search each sheet for the terms
-        for sheet_name in xl.sheet_names:
+
+def _scan_file(file_path: str, display_name: str) -> Tuple[List[Dict[str, Any]], List[tuple]]:
+    """Search a single file with the process-wide matcher, returning (matches, warnings)."""
+    if _is_excel_file(file_path):
+        return search_excel_file(_scanner_matcher.search_terms, file_path)
+    try:
+        return search_text_file(_scanner_matcher, file_path, display_name), []
+    except Exception as e:
+        return [], [(str(file_path), str(e))]
+
+
+def _scan_batch(batch: List[tuple]) -> List[tuple]:
+    """Search a batch of files in one worker task, returning (matches, warnings) for each."""
+    return [_scan_file(file_path, display_name) for file_path, display_name in batch]
+
+
+def _scan_files(jobs: List[tuple], search_terms: List[str]):
+    """
+    Scan files across all CPU cores, yielding (job index, matches, warnings) as each file finishes.
+
+    Excel files are submitted one per task; text files are batched so that many small files
+    share a task. A single file (or a single core) is scanned in-process to skip the pool
+    start-up cost.
+    """
+    cpu_count = os.cpu_count() or 1
+
+    if len(jobs) <= 1 or cpu_count == 1:
+        _init_scanner(search_terms)
+        for index, (file_path, display_name) in enumerate(jobs):
+            yield (index, *_scan_file(file_path, display_name))
+        return
+
+    excel_indexes = [index for index, (file_path, _) in enumerate(jobs) if _is_excel_file(file_path)]
+    text_indexes = [index for index, (file_path, _) in enumerate(jobs) if not _is_excel_file(file_path)]
+
+    # Keep enough batches to spread the text files over every worker
+    batch_size = max(1, min(TEXT_BATCH_SIZE, len(text_indexes) // (cpu_count * 4)))
+    batches = [[index] for index in excel_indexes]
+    batches += [text_indexes[i:i + batch_size] for i in range(0, len(text_indexes), batch_size)]
+
+    # No point starting workers that would never receive a batch
+    max_workers = min(cpu_count, len(batches))
+    executor = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_scanner, initargs=(search_terms,))
+    try:
+        futures = {executor.submit(_scan_batch, [jobs[index] for index in batch]): batch for batch in batches}
+        for future in as_completed(futures):
+            batch = futures[future]
             try:
-                df = pd.read_excel(file_path, sheet_name=sheet_name)
-
-                # Convert all columns to string and search for the terms
-                for col in df.columns:
-                    if df[col].dtype == 'object' or pd.api.types.is_string_dtype(df[col]):
-                        # Search for each term in this column
-                        for search_term in search_terms:
-                            matches = df[df[col].astype(str).str.contains(search_term, case=False, na=False)]
-                            if not matches.empty:
-                                for idx, row in matches.iterrows():
-                                    # Convert entire row to dictionary for full row data
-                                    full_row_data = {}
-                                    for column in df.columns:
-                                        full_row_data[str(column)] = str(row[column]) if pd.notna(row[column]) else ""
-
-                                    results.add_result(
-                                        str(file_path.name),
-                                        idx + 2,  # +2 because pandas is 0-indexed and Excel starts at 1, plus header
-                                        str(row[col]),
-                                        search_term,
-                                        sheet_name,
-                                        str(col),
-                                        full_row_data
-                                    )
+                outcomes = future.result()
             except Exception as e:
-                print(f"Warning: Could not read sheet '{sheet_name}' in {file_path}: {e}")
+                # A crashed worker loses only its own batch; report each file in it
+                outcomes = [([], [(jobs[index][0], str(e))]) for index in batch]
+            for index, (matches, warnings) in zip(batch, outcomes):
+                yield index, matches, warnings
+    except BaseException:
+        # Ctrl-C (or the caller abandoning the scan) drops queued batches instead of finishing them
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
+
+
+def _walk_files(root: str, file_extensions: frozenset):
+    """
+    Yield paths of files under root whose extension is in file_extensions.
 
-    except Exception as e:
-        print(f"Warning: Could not read Excel file {file_path}: {e}")
+    Uses os.scandir directly: directory entries carry their file type, so no extra stat()
+    or Path object is needed per entry. Symlinked directories are not followed, as with rglob.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        name = entry.name
+                        dot = name.rfind('.')
+                        if dot > 0 and name[dot:].lower() in file_extensions:
+                            yield entry.path
+        except OSError:
+            continue
 
 
 def search_files(search_terms: List[str], search_path: str = ".", file_extensions: List[str] = None) -> SearchResults:
@@ -213,49 +682,40 @@ def search_files(search_terms: List[str], search_path: str = ".", file_extension
     print(f"Searching for {len(search_terms)} term(s) in {search_path}...")
 
     total_files = 0
-    matching_files = 0
 
-    # Collect all files first for progress bar
+    # Collect all files first for progress bar, as (path, name shown in results) pairs
     if search_path.is_file():
-        files_to_search = [search_path] if search_path.suffix.lower() in file_extensions else []
+        jobs = [(str(search_path), search_path.name)] if search_path.suffix.lower() in file_extensions else []
     else:
-        files_to_search = [f for f in search_path.rglob('*') if f.is_file() and f.suffix.lower() in file_extensions]
+        root = str(search_path)
+        prefix_length = len(os.path.join(root, ''))
+        jobs = [(file_path, file_path[prefix_length:]) for file_path in _walk_files(root, frozenset(file_extensions))]
 
-    total_files = len(files_to_search)
+    total_files = len(jobs)
 
-    # Search through files with progress bar
-    for file_path in tqdm(files_to_search, desc="Searching files", unit="file"):
-        initial_results_count = len(results.results)
+    # Search through files in parallel with progress bar
+    file_matches = [[] for _ in jobs]
+    for index, matches, warnings in tqdm(_scan_files(jobs, search_terms), total=total_files, desc="Searching files", unit="file"):
+        file_matches[index] = matches
+        results.warnings.extend(warnings)
 
-        if file_path.suffix.lower() in ['.xlsx', '.xls']:
-            # Handle Excel file
-            search_excel_file(search_terms, file_path, results)
-        else:
-            # Handle text file
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    for line_number, line in enumerate(f, 1):
-                        for search_term in search_terms:
-                            if search_term.lower() in line.lower():
-                                results.add_result(
-                                    str(file_path.name) if search_path.is_file() else str(file_path.relative_to(search_path)),
-                                    line_number,
-                                    line,
-                                    search_term
-                                )
-            except Exception as e:
-                tqdm.write(f"Warning: Could not read file {file_path}: {e}")
+    # Report unreadable files in one write after the progress bar has finished
+    if results.warnings:
+        print("\n".join(f"Warning: Could not read {file_path}: {message}" for file_path, message in results.warnings))
 
-        if len(results.results) > initial_results_count:
-            matching_files += 1
+    # Merge in file order so results do not depend on which worker finished first
+    # Files are counted by their real path; Excel results only carry the base name
+    for (file_path, _), matches in zip(jobs, file_matches):
+        for match in matches:
+            results.add_result(**match, source_path=file_path)
 
-    print(f"Search complete. Found {len(results.results)} matches in {matching_files} files out of {total_files} files searched.")
+    print(f"Search complete. Found {len(results)} matches in {len(results.files_with_hits)} files out of {total_files} files searched.")
     return results
 
 
 def display_results(results: SearchResults, max_display: int = 20):
     """Display search results in a formatted way."""
-    if not results.results:
+    if not len(results):
         print("No results found.")
         return
 
@@ -263,22 +723,22 @@ def display_results(results: SearchResults, max_display: int = 20):
     print("=" * 60)
 
     displayed = 0
-    for result in results.results[:max_display]:
-        print(f"File: {result['file_path']}")
-        if 'matched_term' in result:
-            print(f"Matched term: '{result['matched_term']}'")
-        if 'sheet_name' in result and 'column_name' in result:
-            print(f"Sheet: {result['sheet_name']}, Row {result['line_number']}, Column: {result['column_name']}")
-            print(f"Value: {result['line_content']}")
+    for i in range(min(len(results), max_display)):
+        print(f"File: {results.file_path[i]}")
+        if results.matched_term[i]:
+            print(f"Matched term: '{results.matched_term[i]}'")
+        if results.sheet_name[i] and results.column_name[i]:
+            print(f"Sheet: {results.sheet_name[i]}, Row {results.line_number[i]}, Column: {results.column_name[i]}")
+            print(f"Value: {results.line_content[i]}")
         else:
-            print(f"Line {result['line_number']}: {result['line_content']}")
+            print(f"Line {results.line_number[i]}: {results.line_content[i]}")
         print("-" * 40)
         displayed += 1
 
-    if len(results.results) > max_display:
-        print(f"... and {len(results.results) - max_display} more results")
+    if len(results) > max_display:
+        print(f"... and {len(results) - max_display} more results")
 
-    print(f"\nTotal: {len(results.results)} matches found")
+    print(f"\nTotal: {len(results)} matches found")
 
 
 def main():
@@ -323,7 +783,7 @@ Examples:
     # Handle Excel export
     if args.export or args.output:
         results.save_to_excel(args.output)
-    elif results.results:
+    elif len(results):
         # Ask user if they want to save to Excel
         response = input("\nWould you like to save these results to Excel? (y/n): ").strip().lower()
         if response in ['y', 'yes']: